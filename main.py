@@ -1,12 +1,21 @@
+from __future__ import annotations
+
 import argparse
+from typing import TYPE_CHECKING
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
-from scipy.interpolate import make_interp_spline
-from scipy.signal import savgol_filter 
+
+# matplotlib and scipy are slow to import, so they are only loaded once there is data to plot
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+# shared session so repeated lookups reuse the same keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=16))
 
 
 def main() -> None:
@@ -17,6 +26,13 @@ def main() -> None:
     username = args.username
 
     contributions = get_contributions(username)
+
+    # only ever writing a png, so skip the interactive backend
+    import matplotlib
+    matplotlib.use('Agg')
+    # let Agg drop subpixel vertices from the violin outlines
+    matplotlib.rcParams['path.simplify_threshold'] = 1.0
+
     plot = plot_contributions(contributions, username)
     plot.savefig('contributions.png', dpi=300)
     
@@ -28,40 +44,57 @@ def get_contributions(username: str) -> pd.DataFrame:
     
     # get contribution graph data
     url = f'https://github.com/{username}'
-    html = requests.get(url).text
-    if html == 'Not Found':
+    resp = _SESSION.get(url, timeout=10)
+    if resp.content == b'Not Found':
+        raise ValueError(f'User "{username}" not found on GitHub')
+    # hand lxml the raw bytes so it does its own (C-level) encoding detection
+    soup = BeautifulSoup(resp.content, 'lxml')
+    data = soup.select('div.js-yearly-contributions rect.ContributionCalendar-day')
+    if not data:
         raise ValueError(f'User "{username}" not found on GitHub')
-    soup = BeautifulSoup(html, 'html.parser')
-    graph = soup.find('div', {'class': 'js-yearly-contributions'})
-    data = graph.find_all('rect', {'class': 'ContributionCalendar-day'})
-
-    contributions = pd.DataFrame(columns=['contributions'], dtype='int64')
-    contributions.index.name = 'date'
 
+    # collect everything first and build the frame in one go (growing it row by row with .loc is quadratic)
+    dates, counts = [], []
     for item in data:
         if not item.text: continue
         n_contributions = int(first) if (first := item.text.split(' ')[0]) != 'No' else 0
         date = item.get('data-date')
         if date:
-            contributions.loc[date] = n_contributions
+            dates.append(date)
+            counts.append(n_contributions)
+
+    # int16 is plenty for nearly everyone, but there is no documented daily cap so fall back for outliers
+    counts = np.asarray(counts, dtype=np.int64)
+    if counts.max(initial=0) <= np.iinfo(np.int16).max:
+        counts = counts.astype(np.int16)
+
+    contributions = pd.DataFrame(
+        {'contributions': counts},
+        index = pd.DatetimeIndex(pd.to_datetime(dates, format='%Y-%m-%d', cache=True), name='date')
+    )
     
     # check if plotting will work
     if contributions['contributions'].max() == 0:
         raise ValueError(f'No contributions for the last year could be found for user: {username}')
     
-    # parse dates in index
-    contributions.index = pd.to_datetime(contributions.index)
-    
     return contributions
 
 
 def plot_contributions(contributions: pd.DataFrame, username: str) -> plt.Figure:
     """ Create a violinplot where each day of the week is a body  """
 
+    import matplotlib.pyplot as plt
+
     start, end = contributions.index[0], contributions.index[-1]
-    contributions['day_of_week'] = contributions.index.dayofweek
-    data = contributions.groupby('day_of_week')['contributions'].apply(list).values
-    max_contributions = contributions['contributions'].max()
+
+    # split the counts into one array per day of week (Mon=0 ... Sun=6)
+    vals = contributions['contributions'].to_numpy()
+    dow = contributions.index.dayofweek.to_numpy(dtype=np.int8)
+    order = np.argsort(dow, kind='stable')
+    split_idx = np.searchsorted(dow[order], np.arange(1, 7))
+    data = np.split(vals[order], split_idx)
+    means = np.bincount(dow, weights=vals, minlength=7) / np.bincount(dow, minlength=7)
+    max_contributions = int(vals.max())
     colors = [
         '#ace7ae',  # light green
         '#69c16e',  # slightly darker green
@@ -72,8 +105,8 @@ def plot_contributions(contributions: pd.DataFrame, username: str) -> plt.Figure
     # create figure
     fig, ax = plt.subplots(figsize=(5, 3))
 
-    ax = add_violins(ax, data, colors)
-    ax = add_means(ax, contributions)
+    ax = add_violins(ax, data, colors, means)
+    ax = add_means(ax, means)
     ax = fix_layout(ax, max_contributions)
     ax.set_title(f'Contributions per day of week ({username})')
     
@@ -83,7 +116,7 @@ def plot_contributions(contributions: pd.DataFrame, username: str) -> plt.Figure
     return fig
 
 
-def add_violins(ax: plt.Axes, data: list, colors: list[str]) -> plt.Axes:
+def add_violins(ax: plt.Axes, data: list, colors: list[str], means: np.ndarray) -> plt.Axes:
     """ Add violins to the axes object """
     
     vp = ax.violinplot(
@@ -95,31 +128,29 @@ def add_violins(ax: plt.Axes, data: list, colors: list[str]) -> plt.Axes:
         bw_method = 0.4
     )
 
-    means = [np.mean(d) for d in data]
-    classes = np.linspace(np.min(means), np.max(means), 4)
-    cmap = list(zip(classes, colors))
+    # color each body by the first class boundary its mean falls below
+    classes = np.linspace(means.min(), means.max(), 4)
+    idx = np.clip(np.searchsorted(classes, means), 0, len(colors) - 1)
 
-    for i, body in enumerate(vp['bodies']):
-        mean = means[i]
-        for c, color in cmap:
-            if mean <= c:
-                body.set_facecolor(color)
-                break
+    for body, i in zip(vp['bodies'], idx):
+        body.set_facecolor(colors[i])
         body.set_edgecolor('black')
         body.set_linewidth(.5)
         body.set_alpha(1)
 
     return ax
 
-def add_means(ax: plt.Axes, contributions: pd.DataFrame) -> plt.Axes:
+def add_means(ax: plt.Axes, means: np.ndarray) -> plt.Axes:
     """ Add means to the axes object """
     
-    means = contributions.groupby('day_of_week').mean()
+    from scipy.interpolate import CubicSpline
+
+    days = np.arange(1, 8)
     
     # raw mean points
     ax.scatter(
-        means.index + 1,
-        means['contributions'],
+        days,
+        means,
         marker = 'o',
         color = 'darkgrey',
         edgecolor = 'black',
@@ -128,9 +159,8 @@ def add_means(ax: plt.Axes, contributions: pd.DataFrame) -> plt.Axes:
     )
 
     # smoothed mean
-    smoother = savgol_filter(means['contributions'].to_list(), 3, 2)
     x_ = np.linspace(1, 7, 100)
-    spl = make_interp_spline(means.index + 1, smoother, k=3)
+    spl = CubicSpline(days, means)
     power_smooth = spl(x_)
     ax.plot(
         x_,
@@ -146,6 +176,8 @@ def add_means(ax: plt.Axes, contributions: pd.DataFrame) -> plt.Axes:
 def fix_layout(ax: plt.Axes, max_c: int) -> plt.Axes:
     """ Fix the layout of the axes object """
     
+    from matplotlib.patches import Rectangle
+
     # background
     ax.set_facecolor('#ebedf0')
     for spine in ax.spines.values():